@@ -0,0 +1,108 @@
+# Copyright 2019 Nicolas OBERLI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncProtocol:
+    """
+    Asyncio wrapper around a protocol instance
+
+    All methods of the wrapped instance are available as coroutines. They are
+    run in a dedicated worker thread, so calls to the same Hydrabus are
+    executed in order while the event loop keeps serving other tasks
+    (eg. another Hydrabus).
+
+    Properties are accessed with get() and set(). Objects that talk to
+    Hydrabus themselves (eg. AUX pins) are not exposed, use run() instead.
+
+    :param protocol: Initialized protocol instance (eg. pyHydrabus.SPI)
+
+    :example:
+
+    >>> import asyncio
+    >>> import pyHydrabus
+    >>> async def main():
+    ...     s = pyHydrabus.AsyncProtocol(pyHydrabus.SPI('/dev/ttyACM0'))
+    ...     r = pyHydrabus.AsyncProtocol(pyHydrabus.RawWire('/dev/ttyACM1'))
+    ...     await r.set('sda', 1)
+    ...     await r.run(lambda: setattr(r.protocol.AUX[0], 'value', 1))
+    ...     print(await asyncio.gather(s.read(16), r.read(16)))
+    >>> asyncio.run(main())
+
+    """
+
+    def __init__(self, protocol):
+        self.protocol = protocol
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def __getattr__(self, name):
+        attr = getattr(type(self.protocol), name, None)
+        if isinstance(attr, property):
+            raise AttributeError(f"Use get('{name}') or set('{name}', value)")
+
+        attr = getattr(self.protocol, name)
+        if isinstance(attr, (str, bytes, int, float)) or attr is None:
+            return attr
+        if not callable(attr):
+            raise AttributeError(f"Access '{name}' with run()")
+
+        async def method(*args, **kwargs):
+            return await self._run(attr, *args, **kwargs)
+
+        return method
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a function in the worker thread
+
+        :param func: Function to call (eg. to access the AUX pins)
+        :return: Value returned by the function
+        """
+        return await self._run(func, *args, **kwargs)
+
+    async def get(self, name):
+        """
+        Read a property of the wrapped instance
+
+        :param name: Property name (eg. 'sda')
+        :type name: str
+        :return: Property value
+        """
+        return await self._run(getattr, self.protocol, name)
+
+    async def set(self, name, value):
+        """
+        Set a property of the wrapped instance
+
+        :param name: Property name (eg. 'sda')
+        :type name: str
+        :param value: Value to set
+        """
+        await self._run(setattr, self.protocol, name, value)
+
+    async def close(self):
+        """
+        Close the communication channel, resets Hydrabus and stops the worker thread
+        """
+        await self._run(self.protocol.close)
+        self._executor.shutdown()
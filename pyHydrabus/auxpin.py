@@ -2,6 +2,10 @@ import logging
 
 from .common import set_bit
 
+_CMD_GET_VALUES = b"\xc0"  # 0b11000000
+_CMD_GET_CONFIG = b"\xe0"  # 0b11100000
+_CMD_SET_CONFIG = b"\xf0"  # 0b11110000
+
 
 class AUXPin:
     """
@@ -44,8 +48,7 @@ class AUXPin:
         :return: Auxilary pin config (4 bits pullup for AUX[0-3], 4 bits value for AUX[0-3])
         :rtype: byte
         """
-        CMD = 0b11100000
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_GET_CONFIG)
         return self._hydrabus.read(1)
 
     def _get_values(self):
@@ -55,8 +58,7 @@ class AUXPin:
         :return: Auxilary pin values AUX[0-3]
         :rtype: byte
         """
-        CMD = 0b11000000
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_GET_VALUES)
         return self._hydrabus.read(1)
 
     @property
@@ -104,12 +106,10 @@ class AUXPin:
 
         :param value: The pin direction (0=output, 1=input)
         """
-        CMD = 0b11110000
         PARAM = self._get_config()
         PARAM = set_bit(PARAM, value, self.number)
 
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
-        self._hydrabus.write(PARAM)
+        self._hydrabus.write(_CMD_SET_CONFIG + PARAM)
         if self._hydrabus.read(1) == b"\x01":
             return
         else:
@@ -132,12 +132,10 @@ class AUXPin:
 
         :param value: Auxiliary pin pullup (1=enabled, 0=disabled")
         """
-        CMD = 0b11110000
         PARAM = self._get_config()
         PARAM = set_bit(PARAM, value, 4 + self.number)
 
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
-        self._hydrabus.write(PARAM)
+        self._hydrabus.write(_CMD_SET_CONFIG + PARAM)
         if self._hydrabus.read(1) == b"\x01":
             return
         else:
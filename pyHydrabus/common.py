@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Maximum number of answer bytes left pending when commands are pipelined.
+# Hydrabus stops reading commands when its answers are not read, so this
+# must stay well below the host serial input buffer size.
+PIPELINE_DEPTH = 256
+
 
 def split(seq, length):
     """
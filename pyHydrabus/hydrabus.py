@@ -14,6 +14,7 @@
 
 import time
 import logging
+from contextlib import contextmanager
 
 import serial
 import serial.tools.list_ports
@@ -33,7 +34,8 @@ class Hydrabus:
         :param port: Serial port to use. Will automatically be probed if absent
         """
         self._logger = logging.getLogger(__name__)
-
+        # Pending writes when inside a batch() block
+        self._tx_buf = None
 
         if port == "":
             for port in serial.tools.list_ports.comports():
@@ -59,6 +61,12 @@ class Hydrabus:
         """
         if not self.connected:
             raise serial.SerialException("Not connected.")
+        if self._tx_buf is not None:
+            self._tx_buf += data
+            return
+        self._send(data)
+
+    def _send(self, data):
         try:
             self._logger.debug(f"==>[{str(len(data)).zfill(4)}] {data.hex()}")
             self._serialport.write(data)
@@ -67,6 +75,52 @@ class Hydrabus:
             self._logger.error(f"Cannot send : {e.strerror}")
             raise type(e)(f"Cannot send : {e.strerror}")
 
+    def _flush_tx(self):
+        if self._tx_buf:
+            data = bytes(self._tx_buf)
+            self._tx_buf.clear()
+            self._send(data)
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce writes
+
+        Inside this block, written data is buffered and sent to Hydrabus in
+        a single write when the block exits, or before any read.
+        If the block raises an exception, data still buffered is discarded
+        rather than sending a possibly incomplete command.
+
+        :example:
+
+        >>> n = pyHydrabus.NFC('/dev/hydrabus')
+        >>> # Both commands are sent in a single write
+        >>> with n.batch():
+        ...     n.mode = pyHydrabus.NFC.MODE_ISO_14443A
+        ...     n.rf = 1
+        """
+        if self._tx_buf is not None:
+            # Nested batch, the outer one will send the data
+            yield
+            return
+        self._tx_buf = bytearray()
+        try:
+            yield
+        except BaseException:
+            self._end_batch(send=False)
+            raise
+        self._end_batch()
+
+    def _end_batch(self, send=True):
+        data = bytes(self._tx_buf)
+        self._tx_buf = None
+        if not data:
+            return
+        if send and self.connected:
+            self._send(data)
+        else:
+            self._logger.warning(f"Discarding {len(data)} unsent bytes")
+
     def read(self, length=1):
         """
         Base read primitive
@@ -78,6 +132,7 @@ class Hydrabus:
         """
         if not self.connected:
             raise serial.SerialException("Not connected.")
+        self._flush_tx()
         try:
             data = self._serialport.read(length)
             self._logger.debug(f"<==[{str(length).zfill(4)}] {data.hex()}")
@@ -101,6 +156,7 @@ class Hydrabus:
         :return: Number of bytes
         :rtype: int
         """
+        self._flush_tx()
         return self._serialport.in_waiting
 
     def exit_bbio(self):
@@ -174,6 +230,8 @@ class Hydrabus:
         """
         Close the serial port
         """
+        if self.connected:
+            self._flush_tx()
         self._serialport.close()
 
     @property
@@ -14,6 +14,7 @@
 
 import logging
 from .protocol import Protocol
+from .common import PIPELINE_DEPTH
 
 
 class I2C(Protocol):
@@ -145,13 +146,27 @@ class I2C(Protocol):
         :return: Read data
         :rtype: bytes
         """
+        # Read byte + ACK for each byte, and read byte + NACK for the last one.
+        # Commands are sent by groups, answers are interleaved.
+        length = max(length, 1)
+        step = PIPELINE_DEPTH // 2
         result = []
-        for _ in range(length - 1):
-            result.append(self.read_byte())
-            self.send_ack()
-        result.append(self.read_byte())
-        self.send_nack()
-
+        failed = False
+        for offset in range(0, length, step):
+            count = min(step, length - offset)
+            if offset + count == length:
+                stream = b"\x04\x06" * (count - 1) + b"\x04\x07"
+            else:
+                stream = b"\x04\x06" * count
+            self._hydrabus.write(stream)
+            answer = self._hydrabus.read(len(stream))
+
+            if b"\x00" in answer[1::2]:
+                failed = True
+            result.append(answer[0::2])
+
+        if failed:
+            self._logger.error("Cannot execute command.")
         return b"".join(result)
 
     def bulk_write(self, data=b""):
@@ -14,7 +14,7 @@
 
 import logging
 from .protocol import Protocol
-from .common import split
+from .common import split, PIPELINE_DEPTH
 
 
 class OneWire(Protocol):
@@ -67,7 +67,12 @@ class OneWire(Protocol):
         :return: Read data
         :rtype: bytes
         """
-        return b"".join([self.read_byte() for x in range(read_len)])
+        result = []
+        for offset in range(0, read_len, PIPELINE_DEPTH):
+            count = min(PIPELINE_DEPTH, read_len - offset)
+            self._hydrabus.write(b"\x04" * count)
+            result.append(self._hydrabus.read(count))
+        return b"".join(result)
 
     def bulk_write(self, data=b""):
         """
@@ -73,6 +73,14 @@ class Protocol:
         self._hydrabus.exit_bbio()
         self._hydrabus.close()
 
+    def batch(self):
+        """
+        Coalesce writes sent to Hydrabus until the end of the block
+
+        See :meth:`pyHydrabus.hydrabus.Hydrabus.batch`
+        """
+        return self._hydrabus.batch()
+
     @property
     def hydrabus(self):
         """
@@ -14,7 +14,18 @@
 
 import logging
 from .protocol import Protocol
-from .common import split
+from .common import split, PIPELINE_DEPTH
+
+_CMD_READ_BYTE = b"\x06"  # 0b00000110
+_CMD_READ_BIT = b"\x07"  # 0b00000111
+_CMD_READ_SDA = b"\x08"  # 0b00001000
+_CMD_CLOCK = b"\x09"  # 0b00001001
+_CMD_SET_CLK = (b"\x0a", b"\x0b")  # 0b0000101x
+_CMD_SET_SDA = (b"\x0c", b"\x0d")  # 0b0000110x
+# Bulk clock ticks commands, indexed by number of ticks - 1
+_CMD_BULK_TICKS = [(0b00100000 | n).to_bytes(1, byteorder="big") for n in range(16)]
+# Bulk write commands, indexed by payload length - 1
+_CMD_BULK_WRITE = [(0b00010000 | n).to_bytes(1, byteorder="big") for n in range(16)]
 
 
 class RawWire(Protocol):
@@ -47,10 +58,28 @@ class RawWire(Protocol):
         """
         Sends a clock tick, and return the read bit value
         """
-        CMD = 0b00000111
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_READ_BIT)
         return self._hydrabus.read(1)
 
+    def read_bits(self, num):
+        """
+        Sends clock ticks, and return the read bit values
+
+        Read bit commands are sent by groups of PIPELINE_DEPTH, and the
+        answers of each group are read back in a single read.
+
+        :param num: Number of bits to read
+        :type num: int
+        :return: One byte (0 or 1) per read bit
+        :rtype: bytes
+        """
+        result = []
+        for offset in range(0, num, PIPELINE_DEPTH):
+            count = min(PIPELINE_DEPTH, num - offset)
+            self._hydrabus.write(_CMD_READ_BIT * count)
+            result.append(self._hydrabus.read(count))
+        return b"".join(result)
+
     def read_byte(self):
         """
         Read a byte from the raw wire
@@ -58,17 +87,14 @@ class RawWire(Protocol):
         :return: The read byte
         :rtype: bytes
         """
-        CMD = 0b00000110
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_READ_BYTE)
         return self._hydrabus.read(1)
 
     def clock(self):
         """
         Send a clock tick
         """
-        CMD = 0b00001001
-
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_CLOCK)
         if self._hydrabus.read(1) == b"\x01":
             return True
         else:
@@ -88,10 +114,7 @@ class RawWire(Protocol):
         if not num <= 16:
             raise ValueError("Too many ticks to send")
 
-        CMD = 0b00100000
-        CMD = CMD | (num - 1)
-
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_BULK_TICKS[num - 1])
 
         if self._hydrabus.read(1) == b"\x01":
             return True
@@ -109,10 +132,16 @@ class RawWire(Protocol):
         if not num > 0:
             raise ValueError("Must be a positive integer")
 
-        while num > 16:
-            self.bulk_ticks(16)
-            num = num - 16
-        self.bulk_ticks(num)
+        # Bulk ticks commands are sent by groups of PIPELINE_DEPTH, and the
+        # answers of each group are read back in a single read
+        full, last = divmod(num - 1, 16)
+        stream = _CMD_BULK_TICKS[15] * full + _CMD_BULK_TICKS[last]
+        for window in split(stream, PIPELINE_DEPTH):
+            self._hydrabus.write(window)
+            if self._hydrabus.read(len(window)) != b"\x01" * len(window):
+                self._logger.error("Error sending clocks.")
+                return False
+        return True
 
     def bulk_write(self, data=b""):
         """
@@ -122,15 +151,12 @@ class RawWire(Protocol):
         :param data: Data to be sent
         :type data: bytes
         """
-        CMD = 0b00010000
         if not len(data) > 0:
             raise ValueError("Send at least one byte")
         if not len(data) <= 16:
             raise ValueError("Too many bytes to write")
-        CMD = CMD | (len(data) - 1)
 
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
-        self._hydrabus.write(data)
+        self._hydrabus.write(_CMD_BULK_WRITE[len(data) - 1] + data)
 
         if self._hydrabus.read(1) != b"\x01":
             self._logger.warn("Unknown error.")
@@ -178,6 +204,8 @@ class RawWire(Protocol):
         :return: Read bytes
         :rtype: bytes
         """
+        if not len(data) * 8 >= num_bits:
+            raise ValueError("Not enough data for the number of bits")
         i = 0
 
         while num_bits > 0:
@@ -189,42 +217,62 @@ class RawWire(Protocol):
                 CMD = CMD | num_bits-1
                 num_bits = 0
 
-            self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
-            self._hydrabus.write(data[i].to_bytes(1, byteorder="big"))
-            if self._hydrabus.read(1) == b"\x01":
-                return True
-            else:
+            self._hydrabus.write(CMD.to_bytes(1, byteorder="big") + data[i : i + 1])
+            if self._hydrabus.read(1) != b"\x01":
                 self._logger.error("Error writing bits.")
                 return False
+            i += 1
+        return True
 
     def write(self, data=b""):
         """
         Write on Raw-Wire bus
 
+        Bulk transfers are sent by groups leaving at most PIPELINE_DEPTH
+        answer bytes pending, and the answers of each group are read back in
+        a single read.
+
         :param data: data to be sent
         :type data: bytes
         :return: Read bytes
         :rtype: bytes
         """
-        result = b""
-        for chunk in split(data, 16):
-            result += self.bulk_write(chunk)
-        return result
+        # Each 16 bytes transfer is answered by a status byte and 16 bytes
+        window_size = (PIPELINE_DEPTH // 17) * 16
+        result = []
+        for window in split(data, window_size):
+            chunks = split(window, 16)
+            self._hydrabus.write(
+                b"".join([_CMD_BULK_WRITE[len(chunk) - 1] + chunk for chunk in chunks])
+            )
+
+            answer = self._hydrabus.read(len(chunks) + len(window))
+            offset = 0
+            for chunk in chunks:
+                if answer[offset : offset + 1] != b"\x01":
+                    self._logger.warn("Unknown error.")
+                result.append(answer[offset + 1 : offset + 1 + len(chunk)])
+                offset += 1 + len(chunk)
+        return b"".join(result)
 
     def read(self, length=0):
         """
         Read on Raw-Wire bus
 
+        Read byte commands are sent by groups of PIPELINE_DEPTH, and the
+        answers of each group are read back in a single read.
+
         :param length: Number of bytes to read
         :type length: int
         :return: Read data
         :rtype: bytes
         """
-        result = b""
-        for _ in range(length):
-            result += self.read_byte()
-
-        return result
+        result = []
+        for offset in range(0, length, PIPELINE_DEPTH):
+            count = min(PIPELINE_DEPTH, length - offset)
+            self._hydrabus.write(_CMD_READ_BYTE * count)
+            result.append(self._hydrabus.read(count))
+        return b"".join(result)
 
     @property
     def clk(self):
@@ -236,10 +284,7 @@ class RawWire(Protocol):
     @clk.setter
     def clk(self, value):
         value = value & 1
-        CMD = 0b00001010
-        CMD = CMD | value
-
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_SET_CLK[value])
         if self._hydrabus.read(1) == b"\x01":
             self._clk = value
             return True
@@ -252,17 +297,13 @@ class RawWire(Protocol):
         """
         SDA pin status
         """
-        CMD = 0b00001000
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_READ_SDA)
         return int.from_bytes(self._hydrabus.read(1), byteorder="big")
 
     @sda.setter
     def sda(self, value):
         value = value & 1
-        CMD = 0b00001100
-        CMD = CMD | value
-
-        self._hydrabus.write(CMD.to_bytes(1, byteorder="big"))
+        self._hydrabus.write(_CMD_SET_SDA[value])
         if self._hydrabus.read(1) == b"\x01":
             self._clk = value
             return True
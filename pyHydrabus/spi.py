@@ -15,6 +15,9 @@
 import logging
 from .protocol import Protocol
 
+# Dummy bytes clocked out while reading (one full bulk transfer)
+_DUMMY_BYTES = b"\xff" * 16
+
 
 class SPI(Protocol):
     """
@@ -171,7 +174,7 @@ class SPI(Protocol):
         :return: Read data
         :rtype: bytes
         """
-        result = b""
+        result = []
         if drive_cs == 0:
             self.cs = 0
         while read_len > 0:
@@ -179,11 +182,11 @@ class SPI(Protocol):
                 to_read = 16
             else:
                 to_read = read_len
-            result += self.bulk_write(b"\xff" * to_read)
+            result.append(self.bulk_write(_DUMMY_BYTES[:to_read]))
             read_len -= to_read
         if drive_cs == 0:
             self.cs = 1
-        return result
+        return b"".join(result)
 
     def set_speed(self, speed):
         """
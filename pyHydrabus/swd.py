@@ -12,10 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import logging
 from .rawwire import RawWire
 
 
+def _request(value):
+    """
+    Apply the parity bit to a SWD request header
+
+    :param value: Request header without parity
+    :type value: int
+    :return: The request header
+    :rtype: bytes
+    """
+    tmp = value & 0b00011110
+    if (bin(tmp).count("1") % 2) == 1:
+        value = value | 1 << 5
+    return value.to_bytes(1, byteorder="little")
+
+
+# SWD request headers, indexed by [to_ap][register address bits 3:2]
+_READ_REQUEST = [
+    [_request(0x85 | to_ap << 1 | a << 3) for a in range(4)] for to_ap in range(2)
+]
+_WRITE_REQUEST = [
+    [_request(0x81 | to_ap << 1 | a << 3) for a in range(4)] for to_ap in range(2)
+]
+
+
 class SWD(RawWire):
     """
     SWD protocol handler
@@ -31,17 +56,44 @@ class SWD(RawWire):
 
     """
 
+    # Delay (in seconds) before retrying a transaction answered with WAIT.
+    # It doubles on each retry, up to WAIT_DELAY_MAX. Targets with a known
+    # latency can set both to the same value to retry at a fixed interval.
+    # After WAIT_RETRIES retries, the transaction fails with a ValueError.
+    WAIT_DELAY = 0.0001
+    WAIT_DELAY_MAX = 0.02
+    WAIT_RETRIES = 100
+
     def __init__(self, port=""):
         super().__init__(port)
 
+        # Last value written to the DP SELECT register (None if unknown)
+        self._select = None
         self._config = 0xA
         self._configure_port()
 
-    def _apply_dp_parity(self, value):
-        tmp = value & 0b00011110
-        if (bin(tmp).count("1") % 2) == 1:
-            value = value | 1 << 5
-        return value
+    def _wait_backoff(self, delay):
+        """
+        Sleep before retrying a transaction answered with WAIT
+
+        :param delay: Current delay in seconds
+        :type delay: float
+        :return: Delay to use for the next retry
+        :rtype: float
+        """
+        time.sleep(delay)
+        return min(delay * 2, self.WAIT_DELAY_MAX)
+
+    def _read_ack(self):
+        """
+        Read the 3 ACK bits of a transaction (LSB first)
+
+        The three bits are read at once and decoded together.
+
+        :return: ACK value (1=OK, 2=WAIT, 4=FAULT)
+        :rtype: int
+        """
+        return sum(bit << i for i, bit in enumerate(self.read_bits(3)))
 
     def _sync(self):
         self.write(b"\x00")
@@ -51,10 +103,11 @@ class SWD(RawWire):
         Initiate SWD bus.
         Sends the JTAG-TO-SWD token and sync clocks
         """
+        self._select = None
+        # Token and sync clocks are sent in a single transfer
         self.write(
-            b"\xff\xff\xff\xff\xff\xff\x7b\x9e\xff\xff\xff\xff\xff\xff\x0f"
+            b"\xff\xff\xff\xff\xff\xff\x7b\x9e\xff\xff\xff\xff\xff\xff\x0f\x00"
         )
-        self._sync()
 
     def read_dp(self, addr, to_ap=0):
         """
@@ -70,24 +123,23 @@ class SWD(RawWire):
         >>> # read RDBUFF
         >>> swd.read_dp(0xc)
         """
-        CMD = 0x85
-        CMD = CMD | to_ap << 1
-        CMD = CMD | (addr & 0b1100) << 1
-        CMD = self._apply_dp_parity(CMD)
-
-        self.write(CMD.to_bytes(1, byteorder="little"))
-        status = 0
-        for i in range(3):
-            status += ord(self.read_bit()) << i
+        CMD = _READ_REQUEST[to_ap][(addr & 0b1100) >> 2]
+
+        delay = self.WAIT_DELAY
+        for retry in range(self.WAIT_RETRIES + 1):
+            if retry > 0:
+                # When receiving WAIT, retry transaction with an increasing delay
+                self._sync()
+                self.write_dp(0, 0x0000001F)
+                delay = self._wait_backoff(delay)
+            self.write(CMD)
+            status = self._read_ack()
+            if status != 2:
+                break
         if status == 1:
             retval = int.from_bytes(self.read(4), byteorder="little")
             self._sync()
             return retval
-        elif status == 2:
-            # When receiving WAIT, retry transaction
-            self._sync()
-            self.write_dp(0, 0x0000001F)
-            return self.read_dp(addr, to_ap)
         else:
             self._sync()
             raise ValueError(f"Returned status is {hex(status)}")
@@ -104,31 +156,36 @@ class SWD(RawWire):
         :example:
         >>> write_dp(4, 0x50000000)
         """
-        CMD = 0x81
-        CMD = CMD | to_ap << 1
-        CMD = CMD | (addr & 0b1100) << 1
-        CMD = self._apply_dp_parity(CMD)
-
-        self.write(CMD.to_bytes(1, byteorder="little"))
-        status = 0
-        for i in range(3):
-            status += ord(self.read_bit()) << i
-        self.clocks(2)
-        if status == 2:
-            # When receiving WAIT, retry transaction
-            self._sync()
-            self.write_dp(0, 0x0000001F)
-            return self.write_dp(addr, value, to_ap)
+        CMD = _WRITE_REQUEST[to_ap][(addr & 0b1100) >> 2]
+
+        is_select = to_ap == 0 and (addr & 0b1100) == 8
+        if is_select:
+            self._select = None
+
+        delay = self.WAIT_DELAY
+        for retry in range(self.WAIT_RETRIES + 1):
+            if retry > 0:
+                # When receiving WAIT, retry transaction with an increasing delay
+                self._sync()
+                self.write_dp(0, 0x0000001F)
+                delay = self._wait_backoff(delay)
+            self.write(CMD)
+            status = self._read_ack()
+            self.clocks(2)
+            if status != 2:
+                break
         if status != 1:
             self._sync()
             raise ValueError(f"Returned status is {hex(status)}")
-        self.write(value.to_bytes(4, byteorder="little"))
+        # Send the value and the parity along with the sync clocks in a single transfer
+        parity = bin(value).count("1") % 2
+        self.write(
+            value.to_bytes(4, byteorder="little")
+            + parity.to_bytes(1, byteorder="little")
+        )
 
-        # Send the parity but along with the sync clocks
-        if (bin(value).count("1") % 2) == 1:
-            self.write(b"\x01")
-        else:
-            self.write(b"\x00")
+        if is_select:
+            self._select = value
 
     def read_ap(self, address, bank):
         """
@@ -153,8 +210,9 @@ class SWD(RawWire):
         select_reg = select_reg | address << 24
         # Place bank in register as well
         select_reg = select_reg | (bank & 0b11110000)
-        # Write the SELECT DP register
-        self.write_dp(8, select_reg)
+        # Write the SELECT DP register, unless it already holds this value
+        if select_reg != self._select:
+            self.write_dp(8, select_reg)
         self.read_dp((bank & 0b1100), to_ap=1)
         # Read RDBUFF
         return self.read_dp(0xC)
@@ -179,8 +237,9 @@ class SWD(RawWire):
         select_reg = select_reg | address << 24
         # Place bank in register as well
         select_reg = select_reg | (bank & 0b11110000)
-        # Write the SELECT DP register
-        self.write_dp(8, select_reg)
+        # Write the SELECT DP register, unless it already holds this value
+        if select_reg != self._select:
+            self.write_dp(8, select_reg)
         # Send the actual value to the AP
         self.write_dp((bank & 0b1100), value, to_ap=1)
 
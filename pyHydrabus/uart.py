@@ -65,8 +65,11 @@ class UART(Protocol):
 
         self._hydrabus.write(data)
 
-        for _ in range(len(data)):
-            if self._hydrabus.read(1) != b"\x01":
+        answer = self._hydrabus.read(len(data))
+        if len(answer) != len(data):
+            self._logger.warn("Transfer error.")
+        for status in answer:
+            if status != 0x01:
                 self._logger.warn("Transfer error.")
 
     def write(self, data=b""):